@@ -3,10 +3,25 @@ import asyncio
 import random
 import datetime
 import json
+import logging
+import time
 from pathlib import Path
+import httpx
+from aiohttp import web
 from aiogram import Bot, Dispatcher, types
-from aiogram.filters import Command
-from openai import AsyncOpenAI
+from aiogram.webhook.aiohttp_server import SimpleRequestHandler, setup_application
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+
+try:
+    import h2  # noqa: F401  # httpx needs it for HTTP/2
+    HTTP2_AVAILABLE = True
+except ImportError:  # h2 is optional; fall back to HTTP/1.1
+    HTTP2_AVAILABLE = False
 
 # ===================== Configuration =====================
 
@@ -14,40 +29,144 @@ TELEGRAM_TOKEN = os.getenv("TELEGRAM_TOKEN")
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 CHANNEL_ID = os.getenv("CHANNEL_ID", "")  # e.g., "@your_channel" or leave empty for bot self chat
 
+# Webhook mode (optional): Telegram pushes updates instead of the bot long-polling for them
+WEBHOOK_URL = os.getenv("WEBHOOK_URL", "")  # public base URL, e.g. "https://bot.example.com"; empty = long polling
+WEBHOOK_PATH = os.getenv("WEBHOOK_PATH", "/webhook")
+WEBHOOK_SECRET = os.getenv("WEBHOOK_SECRET", "")  # optional, checked against X-Telegram-Bot-Api-Secret-Token
+WEBAPP_HOST = os.getenv("WEBAPP_HOST", "0.0.0.0")
+WEBAPP_PORT = int(os.getenv("WEBAPP_PORT", "8080"))
+
 # Paths and files
 DATA_DIR = Path("bot_data")
 DATA_DIR.mkdir(exist_ok=True)
-HISTORY_FILE = DATA_DIR / "history.json"
+HISTORY_FILE = DATA_DIR / "history.jsonl"        # append-only log: one {"k": ..., "v": ...} record per line
+LEGACY_HISTORY_FILE = DATA_DIR / "history.json"  # old full-dump format, migrated on first load
+HISTORY_COMPACT_FACTOR = 10  # rewrite the log once it is this many times longer than the live history
 LAST_SENT_FILE = DATA_DIR / "last_sent.txt"
 CITIES_FILE = Path("cities.json")   # array of objects: [{ "name": "Углич", ...}, ...]
 ITEMS_FILE = Path("items.json")     # array of strings: ["ручка", "карандаш", "маркер"]
 
-# OpenAI Chat Completions client
-client = AsyncOpenAI(api_key=OPENAI_API_KEY)
+logger = logging.getLogger("news_bot")
+
+# Scheduler sleeps are padded by this to avoid waking up just before the target
+CLOCK_RESOLUTION = time.get_clock_info("monotonic").resolution
+
+# OpenAI Chat Completions client over a persistent keep-alive pool (HTTP/2 when h2 is installed)
+http_client = DefaultAsyncHttpxClient(
+    limits=httpx.Limits(max_keepalive_connections=4, keepalive_expiry=300),
+    timeout=httpx.Timeout(30.0, connect=5.0),
+    http2=HTTP2_AVAILABLE,
+)
+client = AsyncOpenAI(api_key=OPENAI_API_KEY, http_client=http_client, max_retries=2)
 dp = Dispatcher()
 
 # ===================== Storage / utilities =====================
 
-def load_history() -> dict:
-    """Load history of used items and cities from disk."""
-    if not HISTORY_FILE.exists():
-        return {"items": [], "cities": []}
-    with open(HISTORY_FILE, "r", encoding="utf-8") as f:
-        return json.load(f)
+def json_loads(data: bytes):
+    """Parse JSON bytes, using orjson when it is available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data.decode("utf-8"))
+
+def json_dumps(obj) -> bytes:
+    """Serialize obj to single-line UTF-8 JSON bytes, using orjson when it is available."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+# In-process caches: history and data files are read once and kept in memory
+_HISTORY: dict | None = None
+_HISTORY_PENDING: list[dict] = []  # log records not yet appended to HISTORY_FILE
+_HISTORY_LOG_LINES = 0             # records currently in HISTORY_FILE
+_USED_CITIES: set[str] = set()  # lowercase names, mirrors history["cities"]
+_USED_ITEMS: set[str] = set()   # lowercase names, mirrors history["items"]
+_REMAINING_CITIES: list[int] | None = None  # indices into cities_list not used yet
+_REMAINING_ITEMS: list[int] | None = None   # indices into items_list not used yet
+_LAST_SENT: str | None = None
+_CITIES: list | None = None
+_ITEMS: list | None = None
 
-def save_history(history: dict):
-    """Persist history to disk."""
-    with open(HISTORY_FILE, "w", encoding="utf-8") as f:
-        json.dump(history, f, ensure_ascii=False, indent=2)
+def load_history() -> dict:
+    """Return the in-memory history, replaying the history log from disk on first use."""
+    global _HISTORY, _HISTORY_LOG_LINES
+    if _HISTORY is None:
+        _HISTORY = {"items": [], "cities": []}
+        if HISTORY_FILE.exists():
+            raw = HISTORY_FILE.read_bytes()
+            # A crash mid-append leaves the log without its trailing newline; the next
+            # append must not be glued onto that line, so rewrite the log after replay
+            interrupted = bool(raw) and not raw.endswith(b"\n")
+            lines = [line for line in raw.splitlines() if line.strip()]
+            for n, line in enumerate(lines, 1):
+                try:
+                    record = json_loads(line)
+                except ValueError:
+                    if n < len(lines) or not interrupted:
+                        raise
+                    logger.warning("[HISTORY] Skipping truncated last record in %s", HISTORY_FILE)
+                    break
+                values = _HISTORY.setdefault(record["k"], [])
+                if record["v"] is None:
+                    values.clear()
+                else:
+                    values.append(record["v"])
+                _HISTORY_LOG_LINES += 1
+            if interrupted:
+                compact_history()
+        elif LEGACY_HISTORY_FILE.exists():
+            legacy = json_loads(LEGACY_HISTORY_FILE.read_bytes())
+            _HISTORY["items"].extend(legacy.get("items", []))
+            _HISTORY["cities"].extend(legacy.get("cities", []))
+            compact_history()
+        _USED_CITIES.update(map(str.lower, _HISTORY["cities"]))
+        _USED_ITEMS.update(map(str.lower, _HISTORY["items"]))
+    return _HISTORY
+
+def append_pick(kind: str, value: str | None):
+    """Queue a history record for the next persist; a None value marks a reset of that kind."""
+    _HISTORY_PENDING.append({"k": kind, "v": value})
+
+def compact_history():
+    """Rewrite the history log so it only holds the live entries."""
+    global _HISTORY_LOG_LINES
+    records = [{"k": kind, "v": value} for kind in ("cities", "items") for value in _HISTORY[kind]]
+    tmp_file = HISTORY_FILE.with_suffix(".tmp")
+    tmp_file.write_bytes(b"".join(json_dumps(r) + b"\n" for r in records))
+    tmp_file.replace(HISTORY_FILE)
+    _HISTORY_LOG_LINES = len(records)
+    _HISTORY_PENDING.clear()
+
+def persist_history():
+    """Append pending history records to disk, compacting the log when it grows too long."""
+    global _HISTORY_LOG_LINES
+    if not _HISTORY_PENDING:
+        return
+    live = len(_HISTORY["cities"]) + len(_HISTORY["items"])
+    if _HISTORY_LOG_LINES + len(_HISTORY_PENDING) > HISTORY_COMPACT_FACTOR * max(live, 1):
+        compact_history()
+        return
+    # Encode all pending records and append them in a single write
+    with open(HISTORY_FILE, "ab") as f:
+        f.write(b"".join(json_dumps(r) + b"\n" for r in _HISTORY_PENDING))
+    _HISTORY_LOG_LINES += len(_HISTORY_PENDING)
+    _HISTORY_PENDING.clear()
 
 def load_last_sent_date() -> str:
-    """Load last send date (YYYY-MM-DD) from disk."""
-    if not LAST_SENT_FILE.exists():
-        return ""
-    return LAST_SENT_FILE.read_text(encoding="utf-8").strip()
+    """Return last send date (YYYY-MM-DD), reading it from disk on first use."""
+    global _LAST_SENT
+    if _LAST_SENT is None:
+        if LAST_SENT_FILE.exists():
+            _LAST_SENT = LAST_SENT_FILE.read_text(encoding="utf-8").strip()
+        else:
+            _LAST_SENT = ""
+    return _LAST_SENT
 
 def save_last_sent_date(date_str: str):
-    """Persist last send date to disk."""
+    """Update the cached last send date and persist it to disk if it changed."""
+    global _LAST_SENT
+    if date_str == _LAST_SENT:
+        return
+    _LAST_SENT = date_str
     LAST_SENT_FILE.write_text(date_str, encoding="utf-8")
 
 def was_sent_today() -> bool:
@@ -55,69 +174,103 @@ def was_sent_today() -> bool:
     return load_last_sent_date() == datetime.date.today().isoformat()
 
 def load_cities_list() -> list:
-    """Load cities array from cities.json. Supports both [{...}] and {"cities":[...]} formats."""
+    """Load cities array from cities.json (cached). Supports both [{...}] and {"cities":[...]} formats."""
+    global _CITIES
+    if _CITIES is not None:
+        return _CITIES
     if not CITIES_FILE.exists():
         raise RuntimeError(f"File {CITIES_FILE} not found")
-    with open(CITIES_FILE, "r", encoding="utf-8") as f:
-        cities = json.load(f)
+    cities = json_loads(CITIES_FILE.read_bytes())
     if isinstance(cities, dict) and "cities" in cities:
         cities = cities["cities"]
     if not isinstance(cities, list):
         raise RuntimeError("cities.json must be an array of objects with a 'name' field")
+    # Validate and precompute the lowercase key in the same pass
     for c in cities:
-        if "name" not in c:
-            raise RuntimeError("Each city object must contain the 'name' field")
+        try:
+            c["_name_lower"] = c["name"].lower()
+        except (KeyError, TypeError, AttributeError):
+            raise RuntimeError("Each city object must contain the 'name' field") from None
+    _CITIES = cities
     return cities
 
 def load_items_list() -> list:
-    """Load items array from items.json. Must be an array of strings."""
+    """Load items array from items.json (cached) as (item, lowercase item) pairs. Must be an array of strings."""
+    global _ITEMS
+    if _ITEMS is not None:
+        return _ITEMS
     if not ITEMS_FILE.exists():
         raise RuntimeError(f"File {ITEMS_FILE} not found")
-    with open(ITEMS_FILE, "r", encoding="utf-8") as f:
-        data = json.load(f)
-    if not isinstance(data, list) or not all(isinstance(x, str) for x in data):
-        raise RuntimeError('items.json must be an array of strings, e.g.: ["ручка", "карандаш"]')
-    return data
+    data = json_loads(ITEMS_FILE.read_bytes())
+    error = 'items.json must be an array of strings, e.g.: ["ручка", "карандаш"]'
+    if not isinstance(data, list):
+        raise RuntimeError(error)
+    # Only strings have .lower() among JSON values, so lowercasing doubles as the type check
+    try:
+        items = [(x, x.lower()) for x in data]
+    except AttributeError:
+        raise RuntimeError(error) from None
+    _ITEMS = items
+    return items
 
 # ===================== Unique selection (no repeats) =====================
 
-async def pick_city(cities_list: list) -> str:
-    """Pick a non-repeating city from the provided list; reset history if exhausted."""
-    history = load_history()
-    used = set(map(str.lower, history.get("cities", [])))
-    pool = [c for c in cities_list if c.get("name", "").lower() not in used]
-    if not pool:
+def _unused_indices(keys, used: set[str]) -> list[int]:
+    """Return one index per distinct lowercase key that is not in used (first occurrence wins)."""
+    seen = set(used)
+    remaining = []
+    for i, key in enumerate(keys):
+        if key not in seen:
+            seen.add(key)
+            remaining.append(i)
+    return remaining
+
+def _pop_random(remaining: list[int]) -> int:
+    """Remove and return a random element in O(1) by swapping it with the last one."""
+    pos = random.randrange(len(remaining))
+    remaining[pos], remaining[-1] = remaining[-1], remaining[pos]
+    return remaining.pop()
+
+async def pick_city(cities_list: list, history: dict) -> str:
+    """Pick a non-repeating city and record it in history (in memory only); reset if exhausted."""
+    global _REMAINING_CITIES
+    if _REMAINING_CITIES is None:
+        _REMAINING_CITIES = _unused_indices((c["_name_lower"] for c in cities_list), _USED_CITIES)
+    if not _REMAINING_CITIES:
         # All cities used — reset city history
-        history["cities"] = []
-        save_history(history)
-        pool = cities_list
-    chosen = random.choice(pool)["name"]
+        history["cities"].clear()
+        append_pick("cities", None)
+        _USED_CITIES.clear()
+        _REMAINING_CITIES = _unused_indices((c["_name_lower"] for c in cities_list), _USED_CITIES)
+    city = cities_list[_pop_random(_REMAINING_CITIES)]
+    chosen = city["name"]
     history["cities"].append(chosen)
-    save_history(history)
-    print(f"[CITY] {chosen}")
+    _USED_CITIES.add(city["_name_lower"])
+    append_pick("cities", chosen)
+    logger.info("[CITY] %s", chosen)
     return chosen
 
-async def pick_item(items_list: list) -> str:
-    """Pick a non-repeating item from the provided list; reset history if exhausted."""
-    history = load_history()
-    used = set(map(str.lower, history.get("items", [])))
-    pool = [i for i in items_list if i.lower() not in used]
-    if not pool:
+async def pick_item(items_list: list, history: dict) -> str:
+    """Pick a non-repeating item and record it in history (in memory only); reset if exhausted."""
+    global _REMAINING_ITEMS
+    if _REMAINING_ITEMS is None:
+        _REMAINING_ITEMS = _unused_indices((lower for _, lower in items_list), _USED_ITEMS)
+    if not _REMAINING_ITEMS:
         # All items used — reset item history
-        history["items"] = []
-        save_history(history)
-        pool = items_list
-    chosen = random.choice(pool)
+        history["items"].clear()
+        append_pick("items", None)
+        _USED_ITEMS.clear()
+        _REMAINING_ITEMS = _unused_indices((lower for _, lower in items_list), _USED_ITEMS)
+    chosen, chosen_lower = items_list[_pop_random(_REMAINING_ITEMS)]
     history["items"].append(chosen)
-    save_history(history)
-    print(f"[ITEM] {chosen}")
+    _USED_ITEMS.add(chosen_lower)
+    append_pick("items", chosen)
+    logger.info("[ITEM] %s", chosen)
     return chosen
 
 # ===================== News generation (Chat Completions) =====================
 
-async def generate_news_chat(city: str, item: str) -> str:
-    """Generate a sarcastic short news text using OpenAI Chat Completions (prompt in Russian)."""
-    prompt = f"""Пожалуйста, сгенерируй короткую саркастическую новость (3–4 предложения) в стиле udaff.com о забавном медицинском случае в России.
+NEWS_PROMPT_TEMPLATE = """Пожалуйста, сгенерируй короткую саркастическую новость (3–4 предложения) в стиле udaff.com о забавном медицинском случае в России.
 
 Требования:
 - Город: {city}
@@ -130,6 +283,10 @@ async def generate_news_chat(city: str, item: str) -> str:
 - Начни с заголовка в формате: 🚑 {city}: [краткое описание].
 
 Пиши остроумно и кратко. Каждый элемент делай уникальным при каждом запуске."""
+
+async def generate_news_chat(city: str, item: str) -> str:
+    """Generate a sarcastic short news text using OpenAI Chat Completions (prompt in Russian)."""
+    prompt = NEWS_PROMPT_TEMPLATE.format(city=city, item=item)
     try:
         resp = await client.chat.completions.create(
             model="gpt-4o-mini",
@@ -141,7 +298,7 @@ async def generate_news_chat(city: str, item: str) -> str:
         return text
     except Exception as e:
         # Fallback to a minimal message on API error
-        print(f"[NEWS ERROR] {e}")
+        logger.error("[NEWS ERROR] %s", e)
         return f"🚑 {city}: Местный житель попал в больницу после неудачного эксперимента с предметом «{item}»."
 
 # ===================== Sending and scheduling =====================
@@ -149,46 +306,49 @@ async def generate_news_chat(city: str, item: str) -> str:
 async def send_daily_news(bot: Bot, cities_list: list, items_list: list):
     """Send exactly one message per day; skip if already sent today."""
     if was_sent_today():
-        print(f"[SEND] Already sent today")
+        logger.info("[SEND] Already sent today")
         return
-    city = await pick_city(cities_list)
-    item = await pick_item(items_list)
+    history = load_history()
+    city = await pick_city(cities_list, history)
+    item = await pick_item(items_list, history)
+    persist_history()
     text = await generate_news_chat(city, item)
-    target = CHANNEL_ID or (await bot.get_me()).id
+    # bot.id is parsed from the token, so no getMe round-trip is needed
+    target = CHANNEL_ID or bot.id
     await bot.send_message(target, text)
     save_last_sent_date(datetime.date.today().isoformat())
-    print(f"[SEND] ✅ {datetime.datetime.now()}")
+    logger.info("[SEND] ✅ Sent")
+
+def next_target_time(now: datetime.datetime) -> datetime.datetime:
+    """Pick a random time between 11:00 and 14:59: today if still ahead and not sent yet, else tomorrow."""
+    hour = random.randint(11, 14)
+    minute = random.randint(0, 59)
+    if not was_sent_today():
+        target_time = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+        if target_time > now:
+            return target_time
+    tomorrow = now.date() + datetime.timedelta(days=1)
+    return datetime.datetime.combine(tomorrow, datetime.time(hour, minute))
 
 async def schedule_daily_news(bot: Bot, cities_list: list, items_list: list):
     """Schedule sending at a random time between 11:00 and 14:59 once per day."""
+    loop = asyncio.get_running_loop()
     while True:
-        now = datetime.datetime.now()
-        today = now.date()
-        if was_sent_today():
-            # Plan for the next day
-            tomorrow = today + datetime.timedelta(days=1)
-            hour = random.randint(11, 14)
-            minute = random.randint(0, 59)
-            target_time = datetime.datetime.combine(tomorrow, datetime.time(hour, minute))
-        else:
-            # Plan for today if still within window; else plan for tomorrow
-            hour = random.randint(11, 14)
-            minute = random.randint(0, 59)
-            target_time = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
-            if target_time <= now or now.hour >= 15:
-                tomorrow = today + datetime.timedelta(days=1)
-                hour = random.randint(11, 14)
-                minute = random.randint(0, 59)
-                target_time = datetime.datetime.combine(tomorrow, datetime.time(hour, minute))
-        wait_seconds = (target_time - now).total_seconds()
-        print(f"[SCHEDULER] Next run: {target_time} (in {wait_seconds/3600:.2f} h)")
-        await asyncio.sleep(wait_seconds)
+        target_time = next_target_time(datetime.datetime.now())
+        wait_seconds = (target_time - datetime.datetime.now()).total_seconds()
+        logger.info("[SCHEDULER] Next run: %s (in %.2f h)", target_time, wait_seconds / 3600)
+        # Wall time only picks the target; the sleep itself runs against the monotonic
+        # loop clock. If the wall clock moved back meanwhile (NTP, DST), wait the rest.
+        while (wait_seconds := (target_time - datetime.datetime.now()).total_seconds()) > 0:
+            deadline = loop.time() + wait_seconds
+            # asyncio.sleep() may wake up slightly early (clock resolution)
+            while (remaining := deadline - loop.time()) > 0:
+                await asyncio.sleep(remaining + CLOCK_RESOLUTION)
         if not was_sent_today():
             await send_daily_news(bot, cities_list, items_list)
 
 # ===================== Bot commands =====================
 
-@dp.message(Command("start"))
 async def cmd_start(message: types.Message):
     """Start command: basic help text."""
     await message.answer(
@@ -197,20 +357,21 @@ async def cmd_start(message: types.Message):
         "/stats — статистика"
     )
 
-@dp.message(Command("news"))
-async def cmd_news(message: types.Message):
-    """Generate and send a news message immediately."""
-    try:
-        cities_list = load_cities_list()
-        items_list = load_items_list()
-        city = await pick_city(cities_list)
-        item = await pick_item(items_list)
-        text = await generate_news_chat(city, item)
-        await message.answer(text)
-    except Exception as e:
-        await message.answer(f"❌ Ошибка: {e}")
+def make_cmd_news(cities_list: list, items_list: list):
+    """Build the /news handler around the preloaded cities and items lists."""
+    async def cmd_news(message: types.Message):
+        """Generate and send a news message immediately."""
+        try:
+            history = load_history()
+            city = await pick_city(cities_list, history)
+            item = await pick_item(items_list, history)
+            persist_history()
+            text = await generate_news_chat(city, item)
+            await message.answer(text)
+        except Exception as e:
+            await message.answer(f"❌ Ошибка: {e}")
+    return cmd_news
 
-@dp.message(Command("stats"))
 async def cmd_stats(message: types.Message):
     """Show usage statistics for cities/items and last send date."""
     h = load_history()
@@ -221,16 +382,55 @@ async def cmd_stats(message: types.Message):
         f"✅ Сегодня: {'да' if was_sent_today() else 'нет'}"
     )
 
+def make_router(commands: dict):
+    """Build a single message handler that dispatches commands with one dict lookup."""
+    async def router(message: types.Message):
+        # Like aiogram's Command filter, accept commands sent as a media caption too
+        text = message.text or message.caption
+        if not text or not text.startswith("/"):
+            return
+        command, _, mention = text.split(maxsplit=1)[0].partition("@")
+        handler = commands.get(command)
+        if handler is None:
+            return
+        # "/cmd@other_bot" in group chats is addressed to someone else
+        if mention and mention.lower() != ((await message.bot.me()).username or "").lower():
+            return
+        await handler(message)
+    return router
+
 # ===================== main =====================
 
+async def run_webhook(bot: Bot):
+    """Serve Telegram updates over a webhook until cancelled."""
+    app = web.Application()
+    SimpleRequestHandler(
+        dispatcher=dp,
+        bot=bot,
+        secret_token=WEBHOOK_SECRET or None,
+    ).register(app, path=WEBHOOK_PATH)
+    setup_application(app, dp, bot=bot)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    try:
+        await web.TCPSite(runner, WEBAPP_HOST, WEBAPP_PORT).start()
+        await bot.set_webhook(WEBHOOK_URL.rstrip("/") + WEBHOOK_PATH, secret_token=WEBHOOK_SECRET or None)
+        await asyncio.Event().wait()
+    finally:
+        await runner.cleanup()
+        # start_polling() closes the session itself; the webhook path has to do it here
+        await bot.session.close()
+
 async def main():
-    """Entrypoint: validate config, start scheduler and polling."""
+    """Entrypoint: validate config, start scheduler and webhook server or polling."""
     if not TELEGRAM_TOKEN:
         raise RuntimeError("TELEGRAM_TOKEN is not set")
     if not OPENAI_API_KEY:
         raise RuntimeError("OPENAI_API_KEY is not set")
 
-    # Validate data availability early
+    # Load history and data once; everything below works on the in-memory copies
+    load_history()
+    load_last_sent_date()
     cities_list = load_cities_list()
     items_list = load_items_list()
     if not cities_list:
@@ -239,19 +439,33 @@ async def main():
         raise RuntimeError("items.json is empty or missing")
 
     bot = Bot(token=TELEGRAM_TOKEN)
+    dp.message.register(make_router({
+        "/start": cmd_start,
+        "/news": make_cmd_news(cities_list, items_list),
+        "/stats": cmd_stats,
+    }))
 
     # Background scheduler task
     scheduler_task = asyncio.create_task(schedule_daily_news(bot, cities_list, items_list))
     try:
-        print("🚀 Bot started (Chat Completions, gpt-4o-mini)")
-        await dp.start_polling(bot)
+        if WEBHOOK_URL:
+            logger.info("🚀 Bot started (Chat Completions, gpt-4o-mini, webhook on %s:%s)", WEBAPP_HOST, WEBAPP_PORT)
+            await run_webhook(bot)
+        else:
+            logger.info("🚀 Bot started (Chat Completions, gpt-4o-mini, long polling)")
+            # getUpdates is rejected while a webhook is registered
+            await bot.delete_webhook()
+            await dp.start_polling(bot)
     finally:
         scheduler_task.cancel()
         try:
             await scheduler_task
         except asyncio.CancelledError:
             pass
+        await client.close()
 
 if __name__ == "__main__":
-    # For Docker logs, consider running Python in unbuffered mode or set PYTHONUNBUFFERED=1
+    # Only the bot's own messages at INFO; aiogram/httpx would log every update and request
+    logging.basicConfig(level=logging.WARNING, format="%(asctime)s %(levelname)s %(message)s")
+    logger.setLevel(logging.INFO)
     asyncio.run(main())